@@ -5,4 +5,5 @@ class CoreConfig(AppConfig):
 	default_auto_field = "django.db.models.BigAutoField"
 	name = "core"
 
-
+	def ready(self) -> None:
+		from . import signals  # noqa: F401
@@ -52,6 +52,9 @@ US_STATES = [
 	("WY", "Wyoming"),
 ]
 
-RADIUS_MILES_OPTIONS = [1, 5, 10, 25, 50, 100]
+# Radii (in miles) tried, in order, when a geo search comes back empty.
+RADIUS_EXPANSION_MILES = (1.0, 5.0, 10.0, 25.0, 50.0, 100.0, 500.0)
+
+MAX_SEARCH_LOCATIONS = 20
 
 
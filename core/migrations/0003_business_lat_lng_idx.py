@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+	dependencies = [
+		("core", "0002_seed_businesses"),
+	]
+
+	operations = [
+		migrations.AddIndex(
+			model_name="business",
+			index=models.Index(fields=["latitude", "longitude"], name="business_lat_lng_idx"),
+		),
+	]
@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+	dependencies = [
+		("core", "0003_business_lat_lng_idx"),
+	]
+
+	operations = [
+		migrations.AlterField(
+			model_name="business",
+			name="latitude",
+			field=models.FloatField(),
+		),
+		migrations.AlterField(
+			model_name="business",
+			name="longitude",
+			field=models.FloatField(),
+		),
+	]
@@ -0,0 +1,32 @@
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+	dependencies = [
+		("core", "0004_business_float_coordinates"),
+	]
+
+	operations = [
+		migrations.AlterField(
+			model_name="business",
+			name="latitude",
+			field=models.FloatField(
+				validators=[
+					django.core.validators.MinValueValidator(-90),
+					django.core.validators.MaxValueValidator(90),
+				]
+			),
+		),
+		migrations.AlterField(
+			model_name="business",
+			name="longitude",
+			field=models.FloatField(
+				validators=[
+					django.core.validators.MinValueValidator(-180),
+					django.core.validators.MaxValueValidator(180),
+				]
+			),
+		),
+	]
@@ -1,3 +1,4 @@
+from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 from .constants import US_STATES
 
@@ -6,11 +7,14 @@ class Business(models.Model):
 	name = models.CharField(max_length=255)
 	city = models.CharField(max_length=128)
 	state = models.CharField(max_length=2, choices=US_STATES)
-	latitude = models.DecimalField(max_digits=9, decimal_places=6)
-	longitude = models.DecimalField(max_digits=9, decimal_places=6)
+	latitude = models.FloatField(validators=[MinValueValidator(-90), MaxValueValidator(90)])
+	longitude = models.FloatField(validators=[MinValueValidator(-180), MaxValueValidator(180)])
 
 	class Meta:
 		ordering = ["name"]
+		indexes = [
+			models.Index(fields=["latitude", "longitude"], name="business_lat_lng_idx"),
+		]
 
 	def __str__(self) -> str:
 		return f"{self.name} ({self.city}, {self.state})"
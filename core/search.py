@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import uuid
+from bisect import bisect_right
+from typing import Any, Iterator
+
+from django.core.cache import cache
+from django.db.models import Q, QuerySet
+
+from .constants import RADIUS_EXPANSION_MILES
+from .models import Business
+
+
+EARTH_RADIUS_MILES = 3958.8
+MILES_PER_DEGREE_LAT = 69.0
+
+RESULT_FIELDS = ("id", "name", "city", "state", "latitude", "longitude")
+
+CANDIDATE_CHUNK_SIZE = 2000
+
+SEARCH_CACHE_TIMEOUT = 60
+SEARCH_CACHE_VERSION_KEY = "business-search:version"
+
+Point = tuple[float, float]
+
+
+def haversine_miles(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+	"""
+	Great-circle distance between two lat/lng points, in miles. Reference
+	implementation for the batched _nearest_distance() used by the search.
+	"""
+	phi1 = math.radians(lat1)
+	phi2 = math.radians(lat2)
+	d_phi = phi2 - phi1
+	d_lambda = math.radians(lng2 - lng1)
+	a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+	return 2 * EARTH_RADIUS_MILES * math.asin(math.sqrt(a))
+
+
+def bounding_box(lat: float, lng: float, radius_miles: float) -> tuple[float, float, float, float]:
+	"""
+	Return (min_lat, max_lat, min_lng, max_lng) of a box enclosing the circle
+	of `radius_miles` around the point. The longitude span is widened using the
+	box edge closest to a pole so the circle is always fully covered. Longitudes
+	are not clamped: a circle crossing the antimeridian yields a span past
+	+/-180, which _longitude_ranges() wraps back into range.
+	"""
+	d_lat = radius_miles / MILES_PER_DEGREE_LAT
+	min_lat = max(lat - d_lat, -90.0)
+	max_lat = min(lat + d_lat, 90.0)
+
+	widest_lat = max(abs(min_lat), abs(max_lat))
+	cos_lat = math.cos(math.radians(widest_lat))
+	if cos_lat <= 1e-6:
+		return min_lat, max_lat, -180.0, 180.0
+	d_lng = radius_miles / (MILES_PER_DEGREE_LAT * cos_lat)
+	return min_lat, max_lat, lng - d_lng, lng + d_lng
+
+
+def _longitude_ranges(min_lng: float, max_lng: float) -> list[tuple[float, float]]:
+	"""Split a longitude span from bounding_box() into ranges within [-180, 180]."""
+	if max_lng - min_lng >= 360.0:
+		return [(-180.0, 180.0)]
+	if min_lng < -180.0:
+		return [(min_lng + 360.0, 180.0), (-180.0, max_lng)]
+	if max_lng > 180.0:
+		return [(min_lng, 180.0), (-180.0, max_lng - 360.0)]
+	return [(min_lng, max_lng)]
+
+
+def _bounding_box_q(points: list[Point], radius_miles: float) -> Q:
+	q = Q()
+	for lat, lng in points:
+		min_lat, max_lat, min_lng, max_lng = bounding_box(lat, lng, radius_miles)
+		for lng_range in _longitude_ranges(min_lng, max_lng):
+			q |= Q(latitude__range=(min_lat, max_lat), longitude__range=lng_range)
+	return q
+
+
+def _candidate_rows(
+	businesses: QuerySet[Business],
+	states: list[str],
+	points: list[Point],
+	radius_miles: float | None,
+) -> Iterator[dict[str, Any]]:
+	"""
+	RESULT_FIELDS dicts for businesses in any of `states` or inside the bounding
+	box of any point, fetched with a single query whose filter ORs every
+	location together. Rows are streamed so callers only hold on to the ones
+	they keep.
+	"""
+	q = Q()
+	if states:
+		q |= Q(state__in=states)
+	if points:
+		# The bounding box narrows candidates in SQL (backed by the lat/lng index);
+		# only rows inside it pay for the exact haversine check.
+		q |= _bounding_box_q(points, radius_miles)
+	return businesses.filter(q).values(*RESULT_FIELDS).iterator(chunk_size=CANDIDATE_CHUNK_SIZE)
+
+
+def _prepare_points(points: list[Point]) -> list[tuple[float, float, float]]:
+	"""Per-point (phi, lambda, cos(phi)) in radians, computed once per search."""
+	prepared = []
+	for lat, lng in points:
+		phi = math.radians(lat)
+		prepared.append((phi, math.radians(lng), math.cos(phi)))
+	return prepared
+
+
+def _nearest_distance(lat: float, lng: float, centers: list[tuple[float, float, float]]) -> float:
+	"""
+	Haversine distance in miles from a business to the nearest of `centers`
+	(as returned by _prepare_points). asin/sqrt are monotonic, so the smallest
+	haversine term is picked first and converted to miles only once.
+	"""
+	phi = math.radians(lat)
+	lam = math.radians(lng)
+	cos_phi = math.cos(phi)
+	a = min(
+		math.sin((phi - c_phi) / 2) ** 2 + cos_phi * c_cos * math.sin((lam - c_lam) / 2) ** 2
+		for c_phi, c_lam, c_cos in centers
+	)
+	return 2 * EARTH_RADIUS_MILES * math.asin(math.sqrt(min(a, 1.0)))
+
+
+def search_businesses(
+	locations: list[dict[str, Any]],
+	radius_miles: float | None = None,
+	text: str = "",
+) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+	"""
+	Find businesses in any of the given states or within `radius_miles` of any
+	of the given lat/lng points, optionally filtered by name.
+
+	If nothing matches and there are geo locations, the radius is expanded
+	through RADIUS_EXPANSION_MILES until something does. Returns the matching
+	businesses as RESULT_FIELDS dicts (ordered by name) and metadata describing
+	how the radius was expanded.
+	"""
+	base = Business.objects.all()
+	if text:
+		base = base.filter(name__icontains=text)
+
+	states = sorted({location["state"] for location in locations if "state" in location})
+	points = [(location["lat"], location["lng"]) for location in locations if "lat" in location]
+	centers = _prepare_points(points)
+
+	results = [
+		row
+		for row in _candidate_rows(base, states, points, radius_miles)
+		if row["state"] in states
+		or _nearest_distance(row["latitude"], row["longitude"], centers) <= radius_miles
+	]
+
+	radius_used = radius_miles
+	radii_tried: list[float] = [radius_miles] if points else []
+	if points and not results:
+		# States already came back empty. Fetch geo candidates once at the widest
+		# radius; each expansion step is then a filter over distances already
+		# computed instead of another round-trip.
+		max_radius = RADIUS_EXPANSION_MILES[-1]
+		candidates = []
+		for row in _candidate_rows(base, [], points, max_radius):
+			# Box corners fall outside every expansion radius; don't keep them.
+			distance = _nearest_distance(row["latitude"], row["longitude"], centers)
+			if distance <= max_radius:
+				candidates.append((row, distance))
+
+		start = bisect_right(RADIUS_EXPANSION_MILES, radius_miles)
+		for radius in RADIUS_EXPANSION_MILES[start:]:
+			radii_tried.append(radius)
+			radius_used = radius
+			results = [row for row, distance in candidates if distance <= radius]
+			if results:
+				break
+
+	metadata = {
+		"radius_requested": radius_miles if points else None,
+		"radius_used": radius_used if points else None,
+		"radius_expanded": bool(points) and radius_used != radius_miles,
+		"radius_expansion_sequence": radii_tried,
+		"total_results": len(results),
+	}
+	return results, metadata
+
+
+def search_cache_key(params: dict[str, Any]) -> str:
+	"""
+	Cache key for a validated search request. Keys embed the current cache
+	version, so bumping it with invalidate_search_cache() orphans every
+	previously cached response at once.
+	"""
+	version = cache.get_or_set(SEARCH_CACHE_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+	digest = hashlib.sha256(json.dumps(params, sort_keys=True).encode("utf-8")).hexdigest()
+	return f"business-search:{version}:{digest}"
+
+
+def invalidate_search_cache() -> None:
+	cache.set(SEARCH_CACHE_VERSION_KEY, uuid.uuid4().hex, timeout=None)
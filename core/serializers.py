@@ -1,9 +1,33 @@
+import math
+
+from django.db import models
 from rest_framework import serializers
 
+from .constants import MAX_SEARCH_LOCATIONS, RADIUS_EXPANSION_MILES, US_STATES
 from .models import Business
 
 
+STATE_CODES = frozenset(code for code, _ in US_STATES)
+
+
+class FiniteFloatField(serializers.FloatField):
+	"""FloatField that rejects NaN and infinity; NaN slips past min/max checks."""
+
+	default_error_messages = {"non_finite": "A finite number is required."}
+
+	def to_internal_value(self, data):
+		value = super().to_internal_value(data)
+		if not math.isfinite(value):
+			self.fail("non_finite")
+		return value
+
+
 class BusinessSerializer(serializers.ModelSerializer):
+	serializer_field_mapping = {
+		**serializers.ModelSerializer.serializer_field_mapping,
+		models.FloatField: FiniteFloatField,
+	}
+
 	class Meta:
 		model = Business
 		fields = [
@@ -16,3 +40,57 @@ class BusinessSerializer(serializers.ModelSerializer):
 		]
 
 
+class LocationSerializer(serializers.Serializer):
+	"""A single search location: either a US state code or a lat/lng pair."""
+
+	state = serializers.CharField(max_length=2, required=False)
+	lat = FiniteFloatField(
+		min_value=-90,
+		max_value=90,
+		required=False,
+		error_messages={
+			"min_value": "Latitude must be between -90 and 90.",
+			"max_value": "Latitude must be between -90 and 90.",
+		},
+	)
+	lng = FiniteFloatField(
+		min_value=-180,
+		max_value=180,
+		required=False,
+		error_messages={
+			"min_value": "Longitude must be between -180 and 180.",
+			"max_value": "Longitude must be between -180 and 180.",
+		},
+	)
+
+	def validate_state(self, value: str) -> str:
+		state = value.upper()
+		if state not in STATE_CODES:
+			raise serializers.ValidationError("Invalid state code.")
+		return state
+
+	def validate(self, attrs):
+		has_state = "state" in attrs
+		has_lat = "lat" in attrs
+		has_lng = "lng" in attrs
+		if has_lat != has_lng:
+			raise serializers.ValidationError("Both lat and lng are required for a geo location.")
+		if has_state == has_lat:
+			raise serializers.ValidationError("Provide either a state or a lat/lng pair.")
+		return attrs
+
+
+class BusinessSearchRequestSerializer(serializers.Serializer):
+	locations = LocationSerializer(many=True, allow_empty=False, max_length=MAX_SEARCH_LOCATIONS)
+	radius_miles = FiniteFloatField(
+		min_value=0,
+		max_value=RADIUS_EXPANSION_MILES[-1],
+		required=False,
+	)
+	text = serializers.CharField(required=False, allow_blank=True)
+
+	def validate(self, attrs):
+		has_geo = any("lat" in location for location in attrs["locations"])
+		if has_geo and "radius_miles" not in attrs:
+			raise serializers.ValidationError({"radius_miles": "Required when searching by lat/lng."})
+		return attrs
@@ -0,0 +1,14 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Business
+from .search import invalidate_search_cache
+
+
+@receiver(post_save, sender=Business)
+@receiver(post_delete, sender=Business)
+def business_changed(sender, **kwargs) -> None:
+	# Rotating before commit would let a concurrent search re-cache the old rows
+	# under the new version.
+	transaction.on_commit(invalidate_search_cache)
@@ -0,0 +1,405 @@
+import random
+
+from django.db import connection
+from django.test import SimpleTestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from .constants import MAX_SEARCH_LOCATIONS, RADIUS_EXPANSION_MILES
+from .models import Business
+from .search import (
+	_longitude_ranges,
+	_nearest_distance,
+	_prepare_points,
+	bounding_box,
+	haversine_miles,
+	invalidate_search_cache,
+	search_cache_key,
+)
+
+
+LA = {"lat": 34.052235, "lng": -118.243683}
+README_EXAMPLE_2_POINT = {"lat": 37.9290, "lng": -116.7510}
+MID_PACIFIC = {"lat": 0.0, "lng": -150.0}
+
+
+class SearchTestCase(APITestCase):
+	@classmethod
+	def setUpTestData(cls):
+		# Migrations seed businesses.json; tests work against their own rows only.
+		Business.objects.all().delete()
+		cls.search_url = reverse("business-search")
+
+	def setUp(self):
+		# Cached responses outlive the per-test rollback; orphan them without
+		# clearing unrelated cache entries.
+		invalidate_search_cache()
+
+	def search(self, payload):
+		return self.client.post(self.search_url, payload, format="json")
+
+	def search_ok(self, payload):
+		response = self.search(payload)
+		self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+		return {b["name"] for b in response.data["results"]}, response.data["search_metadata"]
+
+
+class BusinessSearchTest(SearchTestCase):
+	@classmethod
+	def setUpTestData(cls):
+		super().setUpTestData()
+		Business.objects.bulk_create(
+			[
+				Business(name="LA Coffee Shop", city="Los Angeles", state="CA", latitude=34.052235, longitude=-118.243683),
+				Business(name="Pasadena Books", city="Pasadena", state="CA", latitude=34.147785, longitude=-118.144516),
+				Business(name="SF Coffee House", city="San Francisco", state="CA", latitude=37.774929, longitude=-122.419416),
+				Business(name="NY Coffee Bar", city="New York", state="NY", latitude=40.712776, longitude=-74.005974),
+				Business(name="Austin Coffee", city="Austin", state="TX", latitude=30.267153, longitude=-97.743057),
+				Business(name="Tonopah Diner", city="Tonopah", state="NV", latitude=38.067000, longitude=-117.230100),
+			]
+		)
+
+	def test_readme_example_1(self):
+		# States and geo locations share a single query.
+		with self.assertNumQueries(1):
+			names, metadata = self.search_ok(
+				{
+					"locations": [{"state": "CA"}, {"state": "NY"}, LA],
+					"radius_miles": 50,
+					"text": "coffee",
+				}
+			)
+		self.assertEqual(names, {"LA Coffee Shop", "SF Coffee House", "NY Coffee Bar"})
+		self.assertFalse(metadata["radius_expanded"])
+		self.assertEqual(metadata["total_results"], 3)
+
+	def test_readme_example_2_expands_until_match(self):
+		names, metadata = self.search_ok({"locations": [README_EXAMPLE_2_POINT], "radius_miles": 5})
+		self.assertEqual(names, {"Tonopah Diner"})
+		self.assertEqual(
+			metadata,
+			{
+				"radius_requested": 5.0,
+				"radius_used": 50.0,
+				"radius_expanded": True,
+				"radius_expansion_sequence": [5.0, 10.0, 25.0, 50.0],
+				"total_results": 1,
+			},
+		)
+
+	def test_geo_search_within_radius(self):
+		names, metadata = self.search_ok({"locations": [LA], "radius_miles": 5})
+		self.assertEqual(names, {"LA Coffee Shop"})
+		self.assertEqual(metadata["radius_expansion_sequence"], [5.0])
+
+		names, _ = self.search_ok({"locations": [LA], "radius_miles": 10})
+		self.assertEqual(names, {"LA Coffee Shop", "Pasadena Books"})
+
+	def test_multiple_geo_locations(self):
+		with self.assertNumQueries(1):
+			names, _ = self.search_ok(
+				{"locations": [LA, {"lat": 40.7128, "lng": -74.0060}], "radius_miles": 5}
+			)
+		self.assertEqual(names, {"LA Coffee Shop", "NY Coffee Bar"})
+
+	def test_state_search_is_case_insensitive_and_has_no_radius_metadata(self):
+		names, metadata = self.search_ok({"locations": [{"state": "ca"}]})
+		self.assertEqual(names, {"LA Coffee Shop", "Pasadena Books", "SF Coffee House"})
+		self.assertIsNone(metadata["radius_requested"])
+		self.assertIsNone(metadata["radius_used"])
+		self.assertFalse(metadata["radius_expanded"])
+		self.assertEqual(metadata["radius_expansion_sequence"], [])
+
+	def test_text_filter_is_case_insensitive(self):
+		names, _ = self.search_ok({"locations": [{"state": "CA"}], "text": "COFFEE"})
+		self.assertEqual(names, {"LA Coffee Shop", "SF Coffee House"})
+
+	def test_results_are_ordered_by_name(self):
+		response = self.search({"locations": [{"state": "CA"}]})
+		names = [b["name"] for b in response.data["results"]]
+		self.assertEqual(names, sorted(names))
+
+	def test_state_matches_prevent_expansion(self):
+		names, metadata = self.search_ok({"locations": [{"state": "TX"}, MID_PACIFIC], "radius_miles": 1})
+		self.assertEqual(names, {"Austin Coffee"})
+		self.assertFalse(metadata["radius_expanded"])
+		self.assertEqual(metadata["radius_used"], 1.0)
+
+	def test_expansion_to_max_radius_without_results(self):
+		# The requested radius, then one query at the widest radius for every step.
+		with self.assertNumQueries(2):
+			names, metadata = self.search_ok({"locations": [MID_PACIFIC], "radius_miles": 1})
+		self.assertEqual(names, set())
+		self.assertEqual(
+			metadata,
+			{
+				"radius_requested": 1.0,
+				"radius_used": 500.0,
+				"radius_expanded": True,
+				"radius_expansion_sequence": list(RADIUS_EXPANSION_MILES),
+				"total_results": 0,
+			},
+		)
+
+	def test_expansion_starts_after_requested_radius(self):
+		_, metadata = self.search_ok({"locations": [README_EXAMPLE_2_POINT], "radius_miles": 7})
+		self.assertEqual(metadata["radius_expansion_sequence"], [7.0, 10.0, 25.0, 50.0])
+
+
+class BusinessSearchValidationTest(SearchTestCase):
+	def assertBadRequest(self, payload):
+		response = self.search(payload)
+		self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+		return response.data
+
+	def test_invalid_state_code(self):
+		errors = self.assertBadRequest({"locations": [{"state": "ZZ"}]})
+		self.assertEqual(errors["locations"][0]["state"], ["Invalid state code."])
+
+	def test_state_longer_than_two_characters(self):
+		errors = self.assertBadRequest({"locations": [{"state": "CAL"}]})
+		self.assertIn("state", errors["locations"][0])
+
+	def test_state_and_coordinates_together(self):
+		errors = self.assertBadRequest({"locations": [{"state": "CA", **LA}], "radius_miles": 5})
+		self.assertEqual(
+			errors["locations"][0]["non_field_errors"],
+			["Provide either a state or a lat/lng pair."],
+		)
+
+	def test_missing_longitude(self):
+		errors = self.assertBadRequest({"locations": [{"lat": 34.0}], "radius_miles": 5})
+		self.assertEqual(
+			errors["locations"][0]["non_field_errors"],
+			["Both lat and lng are required for a geo location."],
+		)
+
+	def test_empty_location(self):
+		errors = self.assertBadRequest({"locations": [{}]})
+		self.assertIn("non_field_errors", errors["locations"][0])
+
+	def test_coordinates_out_of_range(self):
+		errors = self.assertBadRequest({"locations": [{"lat": 91, "lng": 0}], "radius_miles": 5})
+		self.assertEqual(errors["locations"][0]["lat"], ["Latitude must be between -90 and 90."])
+		errors = self.assertBadRequest({"locations": [{"lat": 0, "lng": -181}], "radius_miles": 5})
+		self.assertEqual(errors["locations"][0]["lng"], ["Longitude must be between -180 and 180."])
+
+	def test_non_finite_numbers(self):
+		for payload in (
+			{"locations": [{"lat": 1, "lng": 2}], "radius_miles": "nan"},
+			{"locations": [{"lat": "nan", "lng": 2}], "radius_miles": 5},
+			{"locations": [{"lat": 1, "lng": "inf"}], "radius_miles": 5},
+		):
+			with self.subTest(payload=payload):
+				self.assertBadRequest(payload)
+
+	def test_radius_required_for_geo_locations(self):
+		errors = self.assertBadRequest({"locations": [LA]})
+		self.assertIn("radius_miles", errors)
+
+	def test_radius_above_maximum(self):
+		errors = self.assertBadRequest({"locations": [LA], "radius_miles": RADIUS_EXPANSION_MILES[-1] + 1})
+		self.assertIn("radius_miles", errors)
+
+	def test_locations_required(self):
+		self.assertBadRequest({"locations": []})
+		self.assertBadRequest({})
+
+	def test_too_many_locations(self):
+		errors = self.assertBadRequest({"locations": [{"state": "CA"} for _ in range(MAX_SEARCH_LOCATIONS + 1)]})
+		self.assertIn("locations", errors)
+
+	def test_get_not_allowed(self):
+		response = self.client.get(self.search_url)
+		self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
+
+
+class BoundingBoxTest(SearchTestCase):
+	CENTER = {"lat": 34.0, "lng": -118.0}
+	ANTIMERIDIAN_CENTER = {"lat": 52.0, "lng": -179.9}
+
+	@classmethod
+	def setUpTestData(cls):
+		super().setUpTestData()
+		Business.objects.bulk_create(
+			[
+				# ~9.7 miles from CENTER, near the corner of its 10-mile box.
+				Business(name="Inside Circle", city="A", state="CA", latitude=34.10, longitude=-117.88),
+				# ~11.5 miles away: inside the 10-mile box but outside the circle.
+				Business(name="Box Corner", city="B", state="CA", latitude=34.12, longitude=-117.86),
+				# Just west of the antimeridian, ~8.5 miles from ANTIMERIDIAN_CENTER.
+				Business(name="Aleutian Outpost", city="C", state="AK", latitude=52.0, longitude=179.9),
+			]
+		)
+
+	def test_exact_distance_refines_bounding_box(self):
+		inside = haversine_miles(34.0, -118.0, 34.10, -117.88)
+		corner = haversine_miles(34.0, -118.0, 34.12, -117.86)
+		self.assertLess(inside, 10)
+		self.assertGreater(corner, 10)
+		min_lat, max_lat, min_lng, max_lng = bounding_box(34.0, -118.0, 10)
+		self.assertTrue(min_lat <= 34.12 <= max_lat and min_lng <= -117.86 <= max_lng)
+
+		names, _ = self.search_ok({"locations": [self.CENTER], "radius_miles": 10})
+		self.assertEqual(names, {"Inside Circle"})
+
+	def test_radius_boundary(self):
+		distance = haversine_miles(34.0, -118.0, 34.10, -117.88)
+
+		names, metadata = self.search_ok({"locations": [self.CENTER], "radius_miles": distance + 1e-9})
+		self.assertEqual(names, {"Inside Circle"})
+		self.assertFalse(metadata["radius_expanded"])
+
+		names, metadata = self.search_ok({"locations": [self.CENTER], "radius_miles": distance - 1e-9})
+		self.assertEqual(names, {"Inside Circle"})
+		self.assertEqual(metadata["radius_used"], 10.0)
+
+	def test_candidates_are_prefiltered_by_bounding_box(self):
+		with CaptureQueriesContext(connection) as queries:
+			self.search_ok({"locations": [self.CENTER], "radius_miles": 10})
+		self.assertEqual(len(queries), 1)
+		sql = queries[0]["sql"]
+		table = Business._meta.db_table
+		self.assertIn(f'"{table}"."latitude" BETWEEN', sql)
+		self.assertIn(f'"{table}"."longitude" BETWEEN', sql)
+
+	def test_search_circle_crossing_antimeridian(self):
+		names, metadata = self.search_ok({"locations": [self.ANTIMERIDIAN_CENTER], "radius_miles": 25})
+		self.assertEqual(names, {"Aleutian Outpost"})
+		self.assertFalse(metadata["radius_expanded"])
+
+
+class DistanceTest(SimpleTestCase):
+	def test_known_distance(self):
+		# Los Angeles to San Francisco is roughly 347 miles.
+		self.assertAlmostEqual(haversine_miles(34.052235, -118.243683, 37.774929, -122.419416), 347.4, places=1)
+		self.assertEqual(haversine_miles(34.0, -118.0, 34.0, -118.0), 0.0)
+
+	def test_nearest_distance_matches_reference_haversine(self):
+		rng = random.Random(42)
+		for _ in range(2000):
+			points = [(rng.uniform(-89, 89), rng.uniform(-179, 179)) for _ in range(rng.randint(1, 5))]
+			lat, lng = rng.uniform(-89, 89), rng.uniform(-179, 179)
+			self.assertAlmostEqual(
+				_nearest_distance(lat, lng, _prepare_points(points)),
+				min(haversine_miles(lat, lng, p_lat, p_lng) for p_lat, p_lng in points),
+				places=6,
+			)
+
+	def assertInBoundingBox(self, lat, lng, radius, other_lat, other_lng):
+		min_lat, max_lat, min_lng, max_lng = bounding_box(lat, lng, radius)
+		self.assertTrue(
+			min_lat <= other_lat <= max_lat
+			and any(low <= other_lng <= high for low, high in _longitude_ranges(min_lng, max_lng)),
+			(lat, lng, radius, other_lat, other_lng),
+		)
+
+	def test_bounding_box_encloses_search_circle(self):
+		rng = random.Random(1234)
+		for _ in range(5000):
+			lat, lng = rng.uniform(-80, 80), rng.uniform(-180, 180)
+			radius = rng.choice(RADIUS_EXPANSION_MILES)
+			other_lat = lat + rng.uniform(-8, 8)
+			# Wrap the offset longitude so circles crossing the antimeridian are covered.
+			other_lng = (lng + rng.uniform(-15, 15) + 180) % 360 - 180
+			if abs(other_lat) > 90 or haversine_miles(lat, lng, other_lat, other_lng) > radius:
+				continue
+			self.assertInBoundingBox(lat, lng, radius, other_lat, other_lng)
+
+	def test_bounding_box_wraps_across_antimeridian(self):
+		for lng, other_lng in ((179.9, -179.9), (-179.9, 179.9)):
+			with self.subTest(lng=lng):
+				self.assertInBoundingBox(52.0, lng, 25, 52.0, other_lng)
+		self.assertEqual(_longitude_ranges(-10.0, 10.0), [(-10.0, 10.0)])
+		self.assertEqual(_longitude_ranges(-190.0, -170.0), [(170.0, 180.0), (-180.0, -170.0)])
+		self.assertEqual(_longitude_ranges(170.0, 190.0), [(170.0, 180.0), (-180.0, -170.0)])
+		self.assertEqual(_longitude_ranges(-200.0, 200.0), [(-180.0, 180.0)])
+
+
+class SearchCacheTest(SearchTestCase):
+	PAYLOAD = {"locations": [{"state": "CA"}]}
+
+	@classmethod
+	def setUpTestData(cls):
+		super().setUpTestData()
+		cls.la_coffee = Business.objects.create(
+			name="LA Coffee Shop", city="Los Angeles", state="CA", latitude=34.052235, longitude=-118.243683
+		)
+
+	def test_repeated_search_is_served_from_cache(self):
+		first = self.search(self.PAYLOAD)
+		with self.assertNumQueries(0):
+			second = self.search(self.PAYLOAD)
+		self.assertEqual(second.status_code, status.HTTP_200_OK)
+		self.assertEqual(second.data, first.data)
+
+	def test_save_invalidates_cached_searches(self):
+		names, _ = self.search_ok(self.PAYLOAD)
+		self.assertEqual(names, {"LA Coffee Shop"})
+
+		with self.captureOnCommitCallbacks(execute=True):
+			Business.objects.create(name="SF Coffee House", city="San Francisco", state="CA", latitude=37.774929, longitude=-122.419416)
+		names, _ = self.search_ok(self.PAYLOAD)
+		self.assertEqual(names, {"LA Coffee Shop", "SF Coffee House"})
+
+		self.la_coffee.name = "LA Tea Shop"
+		with self.captureOnCommitCallbacks(execute=True):
+			self.la_coffee.save()
+		names, _ = self.search_ok(self.PAYLOAD)
+		self.assertEqual(names, {"LA Tea Shop", "SF Coffee House"})
+
+	def test_delete_invalidates_cached_searches(self):
+		names, _ = self.search_ok(self.PAYLOAD)
+		self.assertEqual(names, {"LA Coffee Shop"})
+
+		with self.captureOnCommitCallbacks(execute=True):
+			self.la_coffee.delete()
+		names, _ = self.search_ok(self.PAYLOAD)
+		self.assertEqual(names, set())
+
+	def test_invalidation_waits_for_commit(self):
+		before = search_cache_key(self.PAYLOAD)
+		with self.captureOnCommitCallbacks(execute=True):
+			self.la_coffee.save()
+			self.assertEqual(search_cache_key(self.PAYLOAD), before)
+		self.assertNotEqual(search_cache_key(self.PAYLOAD), before)
+
+	def test_cache_key_depends_on_payload(self):
+		ca = search_cache_key({"locations": [{"state": "CA"}]})
+		self.assertEqual(ca, search_cache_key({"locations": [{"state": "CA"}]}))
+		self.assertNotEqual(ca, search_cache_key({"locations": [{"state": "NY"}]}))
+		self.assertNotEqual(ca, search_cache_key({"locations": [{"state": "CA"}], "text": "coffee"}))
+
+	def test_cache_key_changes_after_invalidation(self):
+		before = search_cache_key(self.PAYLOAD)
+		invalidate_search_cache()
+		self.assertNotEqual(before, search_cache_key(self.PAYLOAD))
+
+
+class BusinessCoordinateValidationTest(APITestCase):
+	payload = {"name": "Test Cafe", "city": "Los Angeles", "state": "CA", "latitude": 34.05, "longitude": -118.24}
+
+	@classmethod
+	def setUpTestData(cls):
+		cls.list_url = reverse("business-list")
+
+	def test_valid_coordinates_are_returned_as_numbers(self):
+		response = self.client.post(self.list_url, self.payload, format="json")
+		self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+		self.assertEqual(response.data["latitude"], 34.05)
+		self.assertEqual(response.data["longitude"], -118.24)
+
+	def test_invalid_coordinates_are_rejected(self):
+		for field, value in (
+			("latitude", 12345.5),
+			("latitude", -90.5),
+			("longitude", 180.5),
+			("latitude", "nan"),
+			("longitude", "inf"),
+		):
+			with self.subTest(field=field, value=value):
+				response = self.client.post(self.list_url, {**self.payload, field: value}, format="json")
+				self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+				self.assertIn(field, response.data)
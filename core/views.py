@@ -1,10 +1,14 @@
+from django.core.cache import cache
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
+from rest_framework.parsers import JSONParser
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
+from rest_framework.renderers import JSONRenderer
 
 from .models import Business
-from .serializers import BusinessSerializer
+from .search import SEARCH_CACHE_TIMEOUT, search_businesses, search_cache_key
+from .serializers import BusinessSearchRequestSerializer, BusinessSerializer
 
 
 class BusinessViewSet(viewsets.ModelViewSet):
@@ -12,10 +16,23 @@ class BusinessViewSet(viewsets.ModelViewSet):
 	serializer_class = BusinessSerializer
 	permission_classes = [AllowAny]
 
-	@action(detail=False, methods=["post", "get"], url_path="search")
+	@action(
+		detail=False,
+		methods=["post"],
+		url_path="search",
+		parser_classes=[JSONParser],
+		renderer_classes=[JSONRenderer],
+	)
 	def search(self, request):
-		# TODO: Implement search based on README spec.
-
-		return Response({"results": []}, status=status.HTTP_200_OK)
+		serializer = BusinessSearchRequestSerializer(data=request.data)
+		serializer.is_valid(raise_exception=True)
 
+		params = serializer.validated_data
+		cache_key = search_cache_key(params)
+		payload = cache.get(cache_key)
+		if payload is None:
+			results, metadata = search_businesses(**params)
+			payload = {"results": results, "search_metadata": metadata}
+			cache.set(cache_key, payload, SEARCH_CACHE_TIMEOUT)
 
+		return Response(payload, status=status.HTTP_200_OK)